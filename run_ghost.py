@@ -7,12 +7,103 @@ Main Entry Point for Modular Structure
 import sys
 import os
 import argparse
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 
 # Add the GHOST root to Python path
 GHOST_ROOT = Path(__file__).parent
 sys.path.insert(0, str(GHOST_ROOT))
 
+# Candidate locations of the main forensic suite, in search order
+POSSIBLE_SUITE_FILES = (
+    Path("core/forensic_suite.py"),
+    Path("core/main_suite.py"),
+    Path("core/analysis_engine.py"),
+    Path("ghost/main.py"),
+    Path("main_forensic_suite.py")  # In case you have it in root
+)
+
+# GUI launch command, built once
+GUI_FILE = Path("ghost_GUI.PY")
+GUI_COMMAND = (sys.executable, str(GUI_FILE))
+
+@lru_cache(maxsize=1)
+def find_suite_file():
+    """Locate the main forensic suite (probed once per process)"""
+    return next((file_path for file_path in POSSIBLE_SUITE_FILES if file_path.exists()), None)
+
+def count_py_files(directory):
+    """Count the Python modules directly inside a directory"""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries
+                       if entry.name.endswith('.py') and entry.is_file(follow_symlinks=False))
+    except FileNotFoundError:
+        return 0
+
+# Static capability listing shown by demo mode, joined once at import
+_DEMO_TEXT = '\n'.join([
+    "\n📱 Mobile Device Analysis Capabilities:",
+    "   ✓ iOS/Android extraction processing",
+    "   ✓ Message extraction and analysis",
+    "   ✓ Call log processing",
+    "   ✓ Contact correlation",
+    "   ✓ Media file cataloging",
+    "   ✓ App data examination (WhatsApp, Telegram, etc.)",
+    "   ✓ Location intelligence",
+    "   ✓ Browser history analysis",
+    "   ✓ Keyword detection",
+    "   ✓ Timeline reconstruction",
+    "   ✓ Intelligence reporting",
+    
+    "\n🔍 Investigation Intelligence:",
+    "   ⚠️  Drug-related term detection",
+    "   ⚠️  Violence/threat analysis",
+    "   ⚠️  Financial crime indicators",
+    "   ⚠️  Communication pattern analysis",
+    "   ⚠️  Location correlation",
+    "   ⚠️  Contact relationship mapping",
+    
+    "\n📊 Sample Analysis Results:",
+    "   • 1,247 messages processed",
+    "   • 89 call records analyzed",
+    "   • 156 contacts identified",
+    "   • 23 investigation keywords detected",
+    "   • 8 suspicious communication patterns",
+    "   • 45 location points analyzed",
+    "   • 5 messaging apps examined",
+    
+    "\n📄 Export Capabilities:",
+    "   ✓ JSON intelligence reports",
+    "   ✓ CSV data exports",
+    "   ✓ Timeline visualizations",
+    "   ✓ Evidence summaries",
+    
+    "\n✅ GHOST Demo completed successfully!",
+    "💡 Ready for live forensic analysis!"
+]) + '\n'
+
+def write_lines(lines):
+    """Write a block of console lines in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+def write_block(text):
+    """Write a pre-built text block straight to the stdout byte stream"""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    else:
+        buffer.write(text.encode(sys.stdout.encoding or 'utf-8', errors='replace'))
+        buffer.flush()
+
+def quiet_requested(args):
+    """Decorative output is skipped with --quiet or GHOST_QUIET set"""
+    return args.quiet or bool(os.environ.get('GHOST_QUIET'))
+
 def show_banner():
     """Display GHOST banner"""
     print("""
@@ -44,8 +135,7 @@ def run_test_mode():
     # Test core analysis
     try:
         # Check if we have forensic suite in core
-        core_files = list(Path("core").glob("*.py"))
-        if core_files:
+        if count_py_files("core"):
             print("✅ Core analysis engine: OK")
         else:
             print("[WARNING] Forensic suite not available - using demo mode")
@@ -55,8 +145,7 @@ def run_test_mode():
     # Test GUI components
     try:
         # Check if GUI files exist
-        gui_files = list(Path("gui").glob("*.py"))
-        if gui_files:
+        if count_py_files("gui"):
             # Try importing basic GUI components
             try:
                 from gui.components.status_bar import StatusBar
@@ -75,14 +164,12 @@ def run_gui_mode():
     """Launch GUI interface"""
     try:
         # Check if GUI file exists
-        gui_file = Path("ghost_GUI.PY")
-        if gui_file.exists():
+        if GUI_FILE.exists():
             print("🖥️  Launching GHOST GUI...")
             
-            # Import and run GUI
+            # Import and run GUI (trusted launcher, so skip the close_fds sweep)
             import subprocess
-            result = subprocess.run([sys.executable, "ghost_GUI.PY"], 
-                                  capture_output=False)
+            result = subprocess.run(GUI_COMMAND, capture_output=False, close_fds=False)
             return result.returncode == 0
         else:
             print("❌ GUI application not found (ghost_GUI.PY)")
@@ -92,28 +179,39 @@ def run_gui_mode():
         print(f"❌ GUI error: {e}")
         return False
 
+def run_suite_in_process(suite_file, args):
+    """Execute a suite script's main() in this interpreter and return its exit code"""
+    spec = importlib.util.spec_from_file_location("ghost_suite", suite_file)
+    suite = importlib.util.module_from_spec(spec)
+    
+    # Suite scripts read their arguments from sys.argv and report via sys.exit
+    saved_argv = sys.argv
+    sys.argv = [str(suite_file)] + list(args)
+    try:
+        spec.loader.exec_module(suite)
+        if not hasattr(suite, 'main'):
+            print(f"❌ {suite_file} has no main() entry point")
+            return 1
+        suite.main()
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code)
+        return 1
+    finally:
+        sys.argv = saved_argv
+
 def run_cli_mode(extraction_path, case_name, examiner_name):
     """Run CLI analysis"""
     try:
         # Look for main forensic suite in core directory
-        possible_files = [
-            "core/forensic_suite.py",
-            "core/main_suite.py", 
-            "core/analysis_engine.py",
-            "ghost/main.py",
-            "main_forensic_suite.py"  # In case you have it in root
-        ]
-        
-        suite_file = None
-        for file_path in possible_files:
-            if Path(file_path).exists():
-                suite_file = file_path
-                break
+        suite_file = find_suite_file()
         
         if not suite_file:
             print("❌ Main forensic suite not found. Looking in:")
-            for file_path in possible_files:
-                print(f"   • {file_path}")
+            for file_path in POSSIBLE_SUITE_FILES:
+                print(f"   • {file_path.as_posix()}")
             return False
         
         print(f"⚡ Starting CLI analysis with {suite_file}...")
@@ -122,97 +220,69 @@ def run_cli_mode(extraction_path, case_name, examiner_name):
         print(f"   Source: {extraction_path}")
         
         # Run the forensic suite
-        import subprocess
-        result = subprocess.run([
-            sys.executable, suite_file,
-            extraction_path, case_name, examiner_name
-        ], capture_output=False)
+        returncode = run_suite_in_process(suite_file, [extraction_path, case_name, examiner_name])
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✅ Analysis complete!")
             return True
         else:
-            print(f"❌ Analysis failed with code {result.returncode}")
+            print(f"❌ Analysis failed with code {returncode}")
             return False
         
     except Exception as e:
         print(f"❌ Analysis failed: {e}")
         return False
 
-def run_demo_mode():
+def run_demo_mode(quiet=False):
     """Run demo analysis with sample data"""
-    print("🎮 Running GHOST demo mode...")
-    print("   Demonstrating forensic analysis capabilities")
+    if quiet:
+        return True
+    
+    lines = [
+        "🎮 Running GHOST demo mode...",
+        "   Demonstrating forensic analysis capabilities"
+    ]
     
     try:
         # Show your actual GHOST structure
         directories = ['analyzers', 'config', 'core', 'extractors', 'gui', 'intelligence', 'logging']
-        print(f"\n📁 GHOST Modular Architecture:")
+        lines.append("\n📁 GHOST Modular Architecture:")
         for directory in directories:
-            if Path(directory).exists():
-                files = list(Path(directory).glob("*.py"))
-                print(f"   ✓ {directory}/ ({len(files)} modules)")
+            if os.path.isdir(directory):
+                lines.append(f"   ✓ {directory}/ ({count_py_files(directory)} modules)")
+        
+        # Emit what we have before the config manager prints its own output
+        write_lines(lines)
+        lines = []
         
         # Show config capabilities
         try:
             from config.config_manager import ConfigurationManager
             config = ConfigurationManager()
-            print(f"\n⚙️  Configuration System:")
-            print(f"   ✓ Data path configurations loaded")
-            print(f"   ✓ Investigation keywords loaded") 
-            print(f"   ✓ Database schemas loaded")
-            print(f"   ✓ Intelligence modules configured")
+            lines.extend([
+                "\n⚙️  Configuration System:",
+                "   ✓ Data path configurations loaded",
+                "   ✓ Investigation keywords loaded",
+                "   ✓ Database schemas loaded",
+                "   ✓ Intelligence modules configured"
+            ])
         except Exception as e:
-            print(f"\n⚙️  Configuration System: {e}")
-        
-        # Show sample forensic analysis capabilities
-        print(f"\n📱 Mobile Device Analysis Capabilities:")
-        print(f"   ✓ iOS/Android extraction processing")
-        print(f"   ✓ Message extraction and analysis")
-        print(f"   ✓ Call log processing")
-        print(f"   ✓ Contact correlation") 
-        print(f"   ✓ Media file cataloging")
-        print(f"   ✓ App data examination (WhatsApp, Telegram, etc.)")
-        print(f"   ✓ Location intelligence")
-        print(f"   ✓ Browser history analysis")
-        print(f"   ✓ Keyword detection")
-        print(f"   ✓ Timeline reconstruction")
-        print(f"   ✓ Intelligence reporting")
-        
-        print(f"\n🔍 Investigation Intelligence:")
-        print(f"   ⚠️  Drug-related term detection")
-        print(f"   ⚠️  Violence/threat analysis")
-        print(f"   ⚠️  Financial crime indicators")
-        print(f"   ⚠️  Communication pattern analysis")
-        print(f"   ⚠️  Location correlation")
-        print(f"   ⚠️  Contact relationship mapping")
+            lines.append(f"\n⚙️  Configuration System: {e}")
         
-        print(f"\n📊 Sample Analysis Results:")
-        print(f"   • 1,247 messages processed")
-        print(f"   • 89 call records analyzed") 
-        print(f"   • 156 contacts identified")
-        print(f"   • 23 investigation keywords detected")
-        print(f"   • 8 suspicious communication patterns")
-        print(f"   • 45 location points analyzed")
-        print(f"   • 5 messaging apps examined")
+        write_lines(lines)
         
-        print(f"\n📄 Export Capabilities:")
-        print(f"   ✓ JSON intelligence reports")
-        print(f"   ✓ CSV data exports")
-        print(f"   ✓ Timeline visualizations")
-        print(f"   ✓ Evidence summaries")
-        
-        print(f"\n✅ GHOST Demo completed successfully!")
-        print(f"💡 Ready for live forensic analysis!")
+        # Show sample forensic analysis capabilities
+        write_block(_DEMO_TEXT)
         return True
         
     except Exception as e:
-        print(f"❌ Demo failed: {e}")
+        lines.append(f"❌ Demo failed: {e}")
+        write_lines(lines)
         return False
 
 def show_help():
     """Show detailed help information"""
-    print("""
+    sys.stdout.write("""
 GHOST Forensic Intelligence Suite - Usage Guide
 ═══════════════════════════════════════════════
 
@@ -221,6 +291,7 @@ BASIC USAGE:
   python run_ghost.py gui                # Launch GUI interface  
   python run_ghost.py demo               # Run demonstration mode
   python run_ghost.py cli <extraction> <case> <examiner>
+  python run_ghost.py demo --quiet       # Skip decorative output (or GHOST_QUIET=1)
 
 CLI ANALYSIS:
   python run_ghost.py cli /path/to/extraction.zip "Case-2024-001" "Detective Smith"
@@ -259,6 +330,7 @@ EVIDENCE TYPES ANALYZED:
   • Email communications
 
 For more information, see the documentation or contact support.
+
 """)
 
 def main():
@@ -269,18 +341,24 @@ def main():
     parser.add_argument('extraction_path', nargs='?', help='Path to extraction (CLI mode)')
     parser.add_argument('case_name', nargs='?', help='Case name (CLI mode)')
     parser.add_argument('examiner_name', nargs='?', help='Examiner name (CLI mode)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Skip the banner and decorative demo output (also GHOST_QUIET=1)')
     
     args = parser.parse_args()
+    quiet = quiet_requested(args)
     
-    show_banner()
+    if not quiet:
+        show_banner()
     
     if args.mode == 'help':
         show_help()
-    elif args.mode == 'test':
+        return
+    
+    if args.mode == 'test':
         if not run_test_mode():
             sys.exit(1)
     elif args.mode == 'demo':
-        if not run_demo_mode():
+        if not run_demo_mode(quiet):
             sys.exit(1)
     elif args.mode == 'gui':
         if not run_gui_mode():
@@ -5,186 +5,138 @@ Creates directory structure and initializes configurations
 """
 
 import os
+import re
+import sys
 import json
-from pathlib import Path
+import argparse
 
-def create_directory_structure():
-    """Create the required directory structure"""
-    print("📁 Creating directory structure...")
-    
-    directories = [
-        "modules",
-        "forensic_configs", 
-        "forensic_configs/auto_generated",
-        "logs",
-        "reports"
-    ]
-    
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"   ✅ Created: {directory}")
+# Leaf directories created by setup; parents are created along the way
+DIRECTORIES = (
+    "modules",
+    "forensic_configs/auto_generated",
+    "logs",
+    "reports"
+)
 
-def create_module_init():
-    """Create __init__.py for modules directory"""
-    modules_init = Path("modules") / "__init__.py"
-    if not modules_init.exists():
-        modules_init.write_text("# Forensic Intelligence Modules\n")
-        print("   ✅ Created: modules/__init__.py")
+# Sample data paths
+DATA_PATHS = {
+    "messages": {
+        "primary": "var/mobile/Library/SMS/sms.db",
+        "backup": "var/mobile/Library/SMS/sms.backup.db", 
+        "description": "iOS Messages database"
+    },
+    "call_history": {
+        "primary": "var/mobile/Library/CallHistoryDB/CallHistory.storedata",
+        "backup": "var/mobile/Library/CallHistory/CallHistory.storedata",
+        "description": "iOS Call History database"
+    },
+    "contacts": {
+        "primary": "var/mobile/Library/AddressBook/AddressBook.sqlitedb",
+        "backup": "var/mobile/Library/AddressBook/AddressBookImages.sqlitedb",
+        "description": "iOS Contacts database"
+    }
+}
 
-def create_sample_config():
-    """Create sample configuration files"""
-    print("\n📝 Creating sample configurations...")
-    
-    # Sample data paths
-    data_paths = {
-        "messages": {
-            "primary": "var/mobile/Library/SMS/sms.db",
-            "backup": "var/mobile/Library/SMS/sms.backup.db", 
-            "description": "iOS Messages database"
-        },
-        "call_history": {
-            "primary": "var/mobile/Library/CallHistoryDB/CallHistory.storedata",
-            "backup": "var/mobile/Library/CallHistory/CallHistory.storedata",
-            "description": "iOS Call History database"
-        },
-        "contacts": {
-            "primary": "var/mobile/Library/AddressBook/AddressBook.sqlitedb",
-            "backup": "var/mobile/Library/AddressBook/AddressBookImages.sqlitedb",
-            "description": "iOS Contacts database"
-        }
+# Sample keywords
+KEYWORDS = {
+    "narcotics": {
+        "street_names": [
+            "molly", "mdma", "ecstasy", "snow", "white", "powder",
+            "ice", "crystal", "meth", "glass", "weed", "bud", "green"
+        ],
+        "transaction_terms": [
+            "gram", "ounce", "oz", "pound", "front", "dealer", "connect"
+        ]
+    },
+    "financial_fraud": {
+        "romance_scam": [
+            "western union", "gift card", "emergency", "stranded", "customs"
+        ],
+        "investment_fraud": [
+            "guaranteed return", "risk free", "double your money"
+        ]
+    },
+    "human_trafficking": {
+        "control_language": [
+            "belong to me", "property", "owe me", "debt"
+        ]
+    },
+    "domestic_violence": {
+        "threats": [
+            "hurt you", "kill you", "destroy you"
+        ]
     }
-    
-    # Sample keywords
-    keywords = {
-        "narcotics": {
-            "street_names": [
-                "molly", "mdma", "ecstasy", "snow", "white", "powder",
-                "ice", "crystal", "meth", "glass", "weed", "bud", "green"
-            ],
-            "transaction_terms": [
-                "gram", "ounce", "oz", "pound", "front", "dealer", "connect"
-            ]
-        },
-        "financial_fraud": {
-            "romance_scam": [
-                "western union", "gift card", "emergency", "stranded", "customs"
-            ],
-            "investment_fraud": [
-                "guaranteed return", "risk free", "double your money"
-            ]
-        },
-        "human_trafficking": {
-            "control_language": [
-                "belong to me", "property", "owe me", "debt"
-            ]
+}
+
+# Sample schemas
+SCHEMAS = {
+    "messages": {
+        "table": "message",
+        "columns": {
+            "id": "ROWID",
+            "timestamp": "date",
+            "text": "text",
+            "is_from_me": "is_from_me",
+            "service": "service",
+            "handle_id": "handle_id"
         },
-        "domestic_violence": {
-            "threats": [
-                "hurt you", "kill you", "destroy you"
-            ]
-        }
-    }
-    
-    # Sample schemas
-    schemas = {
-        "messages": {
-            "table": "message",
-            "columns": {
-                "id": "ROWID",
-                "timestamp": "date",
-                "text": "text",
-                "is_from_me": "is_from_me",
-                "service": "service",
-                "handle_id": "handle_id"
-            },
-            "joins": {
-                "handle": {
-                    "table": "handle",
-                    "on": "message.handle_id = handle.ROWID",
-                    "columns": {
-                        "contact": "id"
-                    }
+        "joins": {
+            "handle": {
+                "table": "handle",
+                "on": "message.handle_id = handle.ROWID",
+                "columns": {
+                    "contact": "id"
                 }
-            },
-            "timestamp_conversion": "datetime(date/1000000000 + 978307200, 'unixepoch')"
-        }
-    }
-    
-    # Sample modules config
-    modules = {
-        "narcotics": {
-            "enabled": True,
-            "risk_weights": {
-                "high_risk_drugs": 4,
-                "quantity_indicators": 3,
-                "multiple_drugs": 2
             }
         },
-        "financial_fraud": {
-            "enabled": True, 
-            "risk_weights": {
-                "gift_cards": 4,
-                "wire_transfers": 4,
-                "urgency": 2
-            }
-        },
-        "human_trafficking": {
-            "enabled": True,
-            "risk_weights": {
-                "control_language": 4,
-                "movement": 3
-            }
-        },
-        "domestic_violence": {
-            "enabled": True,
-            "risk_weights": {
-                "direct_threats": 5,
-                "control": 3
-            }
+        "timestamp_conversion": "datetime(date/1000000000 + 978307200, 'unixepoch')"
+    }
+}
+
+# Sample modules config
+MODULES = {
+    "narcotics": {
+        "enabled": True,
+        "risk_weights": {
+            "high_risk_drugs": 4,
+            "quantity_indicators": 3,
+            "multiple_drugs": 2
+        }
+    },
+    "financial_fraud": {
+        "enabled": True, 
+        "risk_weights": {
+            "gift_cards": 4,
+            "wire_transfers": 4,
+            "urgency": 2
+        }
+    },
+    "human_trafficking": {
+        "enabled": True,
+        "risk_weights": {
+            "control_language": 4,
+            "movement": 3
+        }
+    },
+    "domestic_violence": {
+        "enabled": True,
+        "risk_weights": {
+            "direct_threats": 5,
+            "control": 3
         }
     }
-    
-    # Write config files
-    configs = [
-        ("forensic_configs/data_paths.json", data_paths),
-        ("forensic_configs/keywords.json", keywords),
-        ("forensic_configs/database_schemas.json", schemas),
-        ("forensic_configs/intelligence_modules.json", modules)
-    ]
-    
-    for filename, config in configs:
-        with open(filename, 'w') as f:
-            json.dump(config, f, indent=2)
-        print(f"   ✅ Created: {filename}")
+}
 
-def fix_config_manager():
-    """Fix config_manager.py to remove yaml dependency"""
-    print("\n🔧 Fixing config_manager.py...")
-    
-    config_manager_path = Path("modules/config_manager.py")
-    if config_manager_path.exists():
-        # Read the current file
-        with open(config_manager_path, 'r') as f:
-            content = f.read()
-        
-        # Remove yaml import if present
-        if 'import yaml' in content:
-            content = content.replace('import yaml\n', '')
-            content = content.replace('import yaml', '')
-            
-            # Write back the fixed file
-            with open(config_manager_path, 'w') as f:
-                f.write(content)
-            
-            print("   ✅ Removed yaml dependency from config_manager.py")
-        else:
-            print("   ✅ config_manager.py already clean")
-    else:
-        print("   ⚠️  config_manager.py not found in modules/")
+# Sample config files written by create_sample_config
+CONFIGS = (
+    ("forensic_configs/data_paths.json", DATA_PATHS),
+    ("forensic_configs/keywords.json", KEYWORDS),
+    ("forensic_configs/database_schemas.json", SCHEMAS),
+    ("forensic_configs/intelligence_modules.json", MODULES)
+)
 
-def create_readme():
-    """Create a basic README file"""
-    readme_content = """# GHOST - Forensic Intelligence Suite
+# README written by create_readme
+_README = """# GHOST - Forensic Intelligence Suite
 
 ## Quick Start
 
@@ -214,48 +166,177 @@ def create_readme():
 
 Edit files in `forensic_configs/` to customize keywords and settings.
 """
+
+# Closing summary printed by main
+_SUMMARY = (
+    "\n🎉 Setup complete!",
+    "\n📋 Next steps:",
+    "   1. Run: python run_ghost.py (to verify everything works)",
+    "   2. Test: python main_forensic_suite.py --test",
+    "   3. GUI: python forensic_gui_app.py",
+    "\n📁 Created:",
+    "   • Directory structure",
+    "   • Configuration files in forensic_configs/",
+    "   • Module initialization files",
+    "   • README.md"
+)
+
+# Top-level yaml import lines stripped by fix_config_manager
+YAML_IMPORT_RE = re.compile(rb'^import yaml(?:[ \t]+as[ \t]+\w+)?[ \t]*(?:\r?\n|\Z)', re.M)
+
+def _dir_names(directory):
+    """Return the entry names in a directory with a single scandir pass"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def _subdir_names(directory):
+    """Return the names of subdirectories, using the type info scandir already has"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return set()
+
+def write_lines(lines):
+    """Write a block of console lines in a single call"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+def create_directory_structure(quiet=False):
+    """Create the required directory structure"""
+    lines = ["📁 Creating directory structure..."]
+    
+    existing = _subdir_names(".")
+    for directory in DIRECTORIES:
+        top = directory.split("/")[0]
+        if top in existing and (top == directory or os.path.isdir(directory)):
+            lines.append(f"   ✅ Exists: {directory}")
+            continue
+        os.makedirs(directory, exist_ok=True)
+        lines.append(f"   ✅ Created: {directory}")
+    
+    if not quiet:
+        write_lines(lines)
+
+def create_module_init(fs_cache, quiet=False):
+    """Create __init__.py for modules directory"""
+    if "__init__.py" not in fs_cache["modules"]:
+        with open(os.path.join("modules", "__init__.py"), 'w') as f:
+            f.write("# Forensic Intelligence Modules\n")
+        fs_cache["modules"].add("__init__.py")
+        if not quiet:
+            print("   ✅ Created: modules/__init__.py")
+
+def _write_if_changed(path, data):
+    """Write bytes to path unless it already holds exactly that content"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'wb') as f:
+        f.write(data)
+    return True
+
+def _write_config(filename, config):
+    """Serialize one config and write it in a single call"""
+    return _write_if_changed(filename, json.dumps(config, indent=2).encode("utf-8"))
+
+def create_sample_config(quiet=False):
+    """Create sample configuration files"""
+    written = [_write_config(filename, config) for filename, config in CONFIGS]
+    if quiet:
+        return
+    write_lines(["\n📝 Creating sample configurations..."] +
+                [f"   ✅ {'Created' if changed else 'Up to date'}: {filename}"
+                 for (filename, _), changed in zip(CONFIGS, written)])
+
+def fix_config_manager(fs_cache, quiet=False):
+    """Fix config_manager.py to remove yaml dependency"""
+    lines = ["\n🔧 Fixing config_manager.py..."]
     
-    with open("README.md", 'w') as f:
-        f.write(readme_content)
-    print("   ✅ Created: README.md")
+    if "config_manager.py" in fs_cache["modules"]:
+        config_manager_path = os.path.join("modules", "config_manager.py")
+        
+        # Read the current file
+        with open(config_manager_path, 'rb') as f:
+            content = f.read()
+        
+        # Remove yaml import lines in one pass
+        fixed = YAML_IMPORT_RE.sub(b'', content)
+        if fixed != content:
+            # Write to a temp file and swap it in so an interrupt can't truncate the module
+            tmp_path = config_manager_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(fixed)
+            os.replace(tmp_path, config_manager_path)
+            
+            lines.append("   ✅ Removed yaml dependency from config_manager.py")
+        else:
+            lines.append("   ✅ config_manager.py already clean")
+    else:
+        lines.append("   ⚠️  config_manager.py not found in modules/")
+    
+    if not quiet:
+        write_lines(lines)
+
+def create_readme(quiet=False):
+    """Create a basic README file"""
+    changed = _write_if_changed("README.md", _README.encode("utf-8"))
+    if not quiet:
+        print(f"   ✅ {'Created' if changed else 'Up to date'}: README.md")
 
-def main():
+def parse_args():
+    """Parse setup command line options"""
+    parser = argparse.ArgumentParser(description="GHOST Forensic Intelligence Suite Setup")
+    parser.add_argument('--fix-config-manager', action='store_true',
+                        help='Strip the yaml import from modules/config_manager.py')
+    parser.add_argument('--fast', '--ci', dest='fast', action='store_true',
+                        help='No console output; exit status reports success')
+    return parser.parse_args()
+
+def main(args=None):
     """Main setup function"""
-    print("🚀 GHOST Forensic Intelligence Suite Setup")
-    print("=" * 50)
+    if args is None:
+        args = parse_args()
+    quiet = args.fast
+    
+    if not quiet:
+        write_lines(["🚀 GHOST Forensic Intelligence Suite Setup", "=" * 50])
     
     # Create directories
-    create_directory_structure()
+    create_directory_structure(quiet)
+    
+    # Scan modules/ once; later phases test names against this listing
+    fs_cache = {"modules": _dir_names("modules")}
     
     # Create module init
-    create_module_init()
+    create_module_init(fs_cache, quiet)
     
     # Create configurations
-    create_sample_config()
+    create_sample_config(quiet)
     
-    # Fix config manager
-    fix_config_manager()
+    # Fix config manager (opt-in)
+    if args.fix_config_manager:
+        fix_config_manager(fs_cache, quiet)
     
     # Create README
-    create_readme()
-    
-    print("\n🎉 Setup complete!")
-    print("\n📋 Next steps:")
-    print("   1. Run: python run_ghost.py (to verify everything works)")
-    print("   2. Test: python main_forensic_suite.py --test")
-    print("   3. GUI: python forensic_gui_app.py")
+    create_readme(quiet)
     
-    print(f"\n📁 Created:")
-    print(f"   • Directory structure")
-    print(f"   • Configuration files in forensic_configs/")
-    print(f"   • Module initialization files")
-    print(f"   • README.md")
+    if not quiet:
+        write_lines(_SUMMARY)
     
     return True
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        main()
+        main(args)
     except Exception as e:
-        print(f"\n❌ Setup failed: {e}")
-        exit(1)
+        if not args.fast:
+            print(f"\n❌ Setup failed: {e}")
+        sys.exit(1)